@@ -67,6 +67,7 @@ def _patch_pytest_embedded_unity_menu_parser() -> None:
 
     case_re = re.compile(r'\((\d+)\)\s\"(.+)\"\s(\[.+\])+')
     subcase_re = re.compile(r'\t\((\d+)\)\s\"(.+)\"')
+    tag_re = re.compile(r'\[(.+?)\]')
     benign_prefixes = (
         "Here's the test menu, pick your combo:",
         'Press ENTER to see the list of tests',
@@ -82,7 +83,7 @@ def _patch_pytest_embedded_unity_menu_parser() -> None:
             cm = case_re.match(line)
             if cm is not None:
                 index, name, tag_block = cm.groups()
-                tags = re.findall(r'\[(.+?)\]', tag_block)
+                tags = tag_re.findall(tag_block)
                 if 'multi_stage' in tags:
                     _type = 'multi_stage'
                     tags.remove('multi_stage')
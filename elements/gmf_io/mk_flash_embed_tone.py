@@ -61,16 +61,18 @@ def sanitize_filename(filename: str) -> str:
 
 def get_file_info(path: str) -> Dict[str, int]:
     try:
-        file_list = [x for x in os.listdir(path) if x.lower().endswith(SUPPORTED_EXTENSIONS)]
-        file_list.sort()
-        if not file_list:
+        with os.scandir(path) as it:
+            entries = [x for x in it if x.name.lower().endswith(SUPPORTED_EXTENSIONS)]
+        entries.sort(key=lambda x: x.name)
+        if not entries:
             logger.warning(f'No supported audio files found in {path}')
             return {}
 
         file_info = {}
-        for filename in file_list:
+        for entry in entries:
+            filename = entry.name
             try:
-                size = os.path.getsize(os.path.join(path, filename))
+                size = entry.stat().st_size
                 file_info[filename] = size
                 logger.info(f'Found audio file: {filename} ({size} bytes)')
             except OSError as e:
@@ -163,12 +165,19 @@ def gen_h_file(file_info: Dict[str, int]) -> Tuple[str, str]:
     return '\n'.join(h_file), ''.join(cmake_file)
 
 def write_file(content: str, filepath: str, is_header: bool = False) -> bool:
+    if is_header:
+        content = LICENSE_STR + content
+    # Leave identical output untouched so its mtime does not trigger a rebuild
     try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        with open(filepath, 'w+') as f:
-            if is_header:
-                f.write(LICENSE_STR)
+        with open(filepath, 'r') as f:
+            if f.read() == content:
+                logger.info(f'{filepath} is up to date')
+                return True
+    except (OSError, UnicodeDecodeError):
+        pass
+    try:
+        # Opening with 'w' truncates in place; no separate exists/remove round trip
+        with open(filepath, 'w') as f:
             f.write(content)
         logger.info(f'Successfully wrote {filepath}')
         return True
@@ -44,12 +44,14 @@ import argparse
 import sys
 import os
 import glob
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 import tempfile
 import logging
 
 try:
+    import idf_build_apps
     from idf_build_apps import App, build_apps, find_apps, setup_logging, utils, CMakeApp
 except ImportError:
     print('Warning: Exception in importing package idf_build_apps')
@@ -108,22 +110,22 @@ LOG_LEVELS = {
 }
 
 def print_debug(message):
-    logging.debug(f'\033[37m{message}\033[0m')
+    logging.debug('\033[37m%s\033[0m', message)
 
 def print_info(message):
-    logging.info(f'\033[37m{message}\033[0m')
+    logging.info('\033[37m%s\033[0m', message)
 
 def print_warning(message):
-    logging.warning(f'\033[33m{message}\033[0m')
+    logging.warning('\033[33m%s\033[0m', message)
 
 def print_error(message):
-    logging.error(f'\033[31m{message}\033[0m')
+    logging.error('\033[31m%s\033[0m', message)
 
 
+@lru_cache(maxsize=None)
 def _check_idf_build_apps_version():
-    """Check idf_build_apps version: 2.x uses newer API, 1.x uses older API"""
+    """Check idf_build_apps version: 2.x uses newer API, 1.x uses older API (fixed per process)"""
     try:
-        import idf_build_apps
         version = getattr(idf_build_apps, '__version__', '1.0.0')
         major_version = int(version.split('.')[0])
         return major_version >= 2
@@ -131,6 +133,11 @@ def _check_idf_build_apps_version():
         # Default to older API if version detection fails
         return False
 
+@lru_cache(maxsize=4)
+def _find_manifest_files(project_path):  # type: (str) -> Tuple[str, ...]
+    """Collect .build_test_rules.yml files under project_path, walking the tree once per path"""
+    return tuple(str(p) for p in Path(project_path).glob('**/.build_test_rules.yml'))
+
 def get_cmake_apps(
     paths,
     target,
@@ -163,7 +170,7 @@ def get_cmake_apps(
             check_warnings=False,
             no_preserve=False,
             default_build_targets=default_build_targets,
-            manifest_files=[str(p) for p in Path(os.environ['PROJECT_PATH']).glob('**/.build_test_rules.yml')],
+            manifest_files=list(_find_manifest_files(os.environ['PROJECT_PATH'])),
             **preview_kw,
         )
     else:
@@ -178,17 +185,23 @@ def get_cmake_apps(
             size_json_path='size.json',
             check_warnings=False,
             default_build_targets=default_build_targets,
-            manifest_files=[str(p) for p in Path(os.environ['PROJECT_PATH']).glob('**/.build_test_rules.yml')],
+            manifest_files=list(_find_manifest_files(os.environ['PROJECT_PATH'])),
         )
     return apps
 
-def _collect_app_without_pytest(app_path, apps_without_pytest):
-    pytest_files = glob.glob(os.path.join(app_path, 'pytest_*.py'))
-    if not pytest_files:
+def _collect_app_without_pytest(app_path, apps_without_pytest, filenames=None):
+    # Reuse the directory listing from os.walk when we have one instead of globbing again
+    if filenames is None:
+        has_pytest = bool(glob.glob(os.path.join(app_path, 'pytest_*.py')))
+    else:
+        has_pytest = any(name.startswith('pytest_') and name.endswith('.py') for name in filenames)
+    if not has_pytest:
         apps_without_pytest.append(app_path)
 
-def _check_target_dir_type(app_path, target_dir_type):
+def _check_target_dir_type(app_parts, target_dir_type):
     """
+    app_parts is the app path already split on os.sep.
+
     Note on APP_TYPE_EXAMPLE:
     Despite its name suggesting only example apps, it actually matches all non-test apps.
     - APP_TYPE_TEST_APPS: strictly matches apps in test_apps directories
@@ -196,20 +209,22 @@ def _check_target_dir_type(app_path, target_dir_type):
     - APP_TYPE_ALL: matches all apps regardless of directory
     """
     if target_dir_type == APP_TYPE_TEST_APPS:
-        return APP_TYPE_TEST_APPS in app_path.split(os.sep)
+        return APP_TYPE_TEST_APPS in app_parts
     elif target_dir_type == APP_TYPE_EXAMPLE:
         # Note: This matches all non-test apps, not just examples
-        return APP_TYPE_TEST_APPS not in app_path.split(os.sep)
+        return APP_TYPE_TEST_APPS not in app_parts
     return True
 
-def _collect_valid_app(root, target_dir_type, check_pytest, filtered_paths, apps_without_pytest):
-    if 'managed_components' in root.split(os.sep):
+def _collect_valid_app(root, target_dir_type, check_pytest, filtered_paths, apps_without_pytest, filenames=None):
+    # Split once per directory; both checks below need the path components
+    root_parts = root.split(os.sep)
+    if 'managed_components' in root_parts:
         return
 
-    if CMakeApp.is_app(root) and _check_target_dir_type(root, target_dir_type):
+    if CMakeApp.is_app(root) and _check_target_dir_type(root_parts, target_dir_type):
         filtered_paths.append(root)
         if check_pytest:
-            _collect_app_without_pytest(root, apps_without_pytest)
+            _collect_app_without_pytest(root, apps_without_pytest, filenames)
 
 def find_apps_with_filter(paths, target_dir_type=APP_TYPE_ALL, check_pytest=False):
     """
@@ -238,7 +253,7 @@ def find_apps_with_filter(paths, target_dir_type=APP_TYPE_ALL, check_pytest=Fals
 
         # If not an app or even if it is, still walk through subdirectories
         for root, dirs, files in os.walk(base_path):
-            _collect_valid_app(root, target_dir_type, check_pytest, filtered_paths, apps_without_pytest)
+            _collect_valid_app(root, target_dir_type, check_pytest, filtered_paths, apps_without_pytest, files)
 
     return filtered_paths, apps_without_pytest
 
@@ -256,21 +271,14 @@ def check_pytest_files(app_paths, is_error=False, output_to_stderr=False):
     """
     apps_without_pytest = []
     for app_path in app_paths:
-        pytest_files = glob.glob(os.path.join(app_path, 'pytest_*.py'))
-        if not pytest_files:
-            apps_without_pytest.append(app_path)
+        _collect_app_without_pytest(app_path, apps_without_pytest)
 
     if apps_without_pytest:
-        if is_error:
-            print_error(f'{ERROR_ICON} {PYTEST_MISSING_MSG}')
-            for path in apps_without_pytest:
-                print_error(f'  - {path}')
-            print_error(PYTEST_ADD_MSG)
-        else:
-            print_warning(f'{WARNING_ICON} {PYTEST_MISSING_MSG}')
-            for path in apps_without_pytest:
-                print_warning(f'  - {path}')
-            print_warning(PYTEST_ADD_MSG)
+        report, icon = (print_error, ERROR_ICON) if is_error else (print_warning, WARNING_ICON)
+        report(f'{icon} {PYTEST_MISSING_MSG}')
+        for path in apps_without_pytest:
+            report(f'  - {path}')
+        report(PYTEST_ADD_MSG)
         return False
 
     return True
@@ -286,7 +294,7 @@ def _get_removed_apps(filtered_paths, built_apps):
     Returns:
         List of app paths that were removed by build rules
     """
-    built_paths = set(app.app_dir for app in built_apps)
+    built_paths = {app.app_dir for app in built_apps}
     return [path for path in filtered_paths if path not in built_paths]
 
 def _append_sdkconfig_default(existing_defaults, default_path):
@@ -333,20 +341,13 @@ def _handle_find_mode(args, filtered_paths) -> List[str]:
         enable_preview_targets=getattr(args, 'enable_preview_targets', True),
     )
 
-    exclude_apps = getattr(args, 'exclude_apps', [])
+    exclude_apps = set(getattr(args, 'exclude_apps', None) or ())
     if exclude_apps:
         apps = [app for app in apps if app.name not in exclude_apps]
 
-    # Deduplicate app paths (same app may have multiple configs/targets)
-    unique_paths = []
-    seen_paths = set()
-    for app in apps:
-        if app.app_dir not in seen_paths:
-            unique_paths.append(app.app_dir)
-            seen_paths.add(app.app_dir)
-
-    # Output as bash array and set environment variable
-    sorted_paths = sorted(unique_paths)
+    # Deduplicate app paths (same app may have multiple configs/targets);
+    # the result is sorted, so insertion order does not need to be kept
+    sorted_paths = sorted({app.app_dir for app in apps})
 
     # Check for missing pytest files before setting environment variable
     if not args.no_require_pytest:
@@ -395,12 +396,12 @@ def _handle_build_mode(args, filtered_paths):
             print_warning(f'  - {path}')
 
     # Check for missing pytest files in collected apps
-    unique_app_paths = list(set(app.app_dir for app in apps))
+    unique_app_paths = list({app.app_dir for app in apps})
     if not args.no_require_pytest:
         if not check_pytest_files(unique_app_paths, is_error=True):
             sys.exit(1)  # Exit with error code if pytest files are missing
 
-    exclude_apps = getattr(args, 'exclude_apps', [])
+    exclude_apps = set(getattr(args, 'exclude_apps', None) or ())
     apps_to_build = [app for app in apps if app.name not in exclude_apps] if exclude_apps else apps[:]
 
     print_info(FOUND_APPS_MSG.format(len(apps_to_build)))
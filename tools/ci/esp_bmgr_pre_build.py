@@ -17,7 +17,9 @@ import json
 import argparse
 import subprocess
 import logging
-from typing import Dict, List, Optional
+import traceback
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
 from pathlib import Path
 from build_apps import (
     get_app_paths,
@@ -36,13 +38,19 @@ logging.basicConfig(
     format='%(message)s'
 )
 
-def _target_is_idf_preview(target: str) -> bool:
-    """True if *target* is an ESP-IDF preview chip (requires idf.py --preview)."""
+@lru_cache(maxsize=None)
+def _idf_preview_targets() -> FrozenSet[str]:
+    """Resolve preview chips once; a failed import is retried by Python on every call."""
     try:
         from esp_bool_parser import PREVIEW_TARGETS
-        return target in PREVIEW_TARGETS
+        return frozenset(PREVIEW_TARGETS)
     except Exception:
-        return False
+        return frozenset()
+
+
+def _target_is_idf_preview(target: str) -> bool:
+    """True if *target* is an ESP-IDF preview chip (requires idf.py --preview)."""
+    return target in _idf_preview_targets()
 
 
 def _idf_py_cmd(target: str, *idf_args: str) -> List[str]:
@@ -104,7 +112,6 @@ def get_app_list(
 
     except Exception as e:
         print_error(f'Error: Failed to get application list: {e}')
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -161,8 +168,8 @@ def _execute_command_for_app(
         print_info(f'  [Dry run] Skipping actual execution')
         return
 
+    cmd_str = ' '.join(cmd)
     try:
-        cmd_str = ' '.join(cmd)
         result = subprocess.run(
             cmd,
             cwd=app_path,
@@ -181,7 +188,6 @@ def _execute_command_for_app(
                 error_func(f'  Error: {result.stderr[:200]}')
 
     except Exception as e:
-        cmd_str = ' '.join(cmd)
         print_error(f'  ✗ Exception: {cmd_str} - {e}')
 
 
@@ -210,10 +216,6 @@ def _is_depending_on_esp_board_manager(app_path: str) -> bool:
     """
     project_desc_path = os.path.join(app_path, 'build', 'project_description.json')
 
-    if not os.path.exists(project_desc_path):
-        print_warning(f'  Warning: {project_desc_path} does not exist, skipping gen-bmgr-config')
-        return False
-
     try:
         with open(project_desc_path, 'r', encoding='utf-8') as f:
             project_desc = json.load(f)
@@ -229,6 +231,9 @@ def _is_depending_on_esp_board_manager(app_path: str) -> bool:
             print_info(f'  Info: esp_board_manager not found in build_components, skipping gen-bmgr-config')
             return False
 
+    except FileNotFoundError:
+        print_warning(f'  Warning: {project_desc_path} does not exist, skipping gen-bmgr-config')
+        return False
     except json.JSONDecodeError as e:
         print_warning(f'  Warning: Failed to parse {project_desc_path}: {e}, skipping gen-bmgr-config')
         return False
@@ -248,13 +253,14 @@ def set_board_for_app(app_path: str, board: str, dry_run: bool = False, idf_targ
         dry_run: Whether to simulate execution only
         idf_target: Chip target (used to add idf.py --preview for preview SoCs)
     """
-    if not _is_depending_on_esp_board_manager(app_path):
-        return
-
+    # Cheap argument check first; the dependency check reads and parses project_description.json
     if not board or not board.strip():
         print_info('  Info: --board is empty, skipping bmgr board config')
         return
 
+    if not _is_depending_on_esp_board_manager(app_path):
+        return
+
     idf_env = _idf_env_for_app(app_path)
     if idf_env is None:
         print_warning(
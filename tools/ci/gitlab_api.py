@@ -13,12 +13,17 @@ import gitlab
 
 TR = Callable[..., Any]
 
+# UTF-16 BE/LE and UTF-8 byte order mark sequences, stripped in a single pass
+BOM_RE = re.compile(r'\xfe\xff|\xff\xfe|\xef\xbb\xbf')
+
 def remove_BOM(config_path):   # remove BOM field
-    content = open(config_path).read()
-    content = re.sub(r'\xfe\xff','', content)
-    content = re.sub(r'\xff\xfe','', content)
-    content = re.sub(r'\xef\xbb\xbf','', content)
-    open(config_path, 'w').write(content)
+    with open(config_path) as f:
+        content = f.read()
+    content, count = BOM_RE.subn('', content)
+    if not count:
+        return  # nothing stripped: leave the file untouched
+    with open(config_path, 'w') as f:
+        f.write(content)
 
 def retry(func: TR) -> TR:
     """
@@ -44,15 +44,17 @@ import os
 import re
 import shutil
 import signal
+import stat
 import subprocess
 import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
 
 try:
     import fcntl
@@ -64,6 +66,9 @@ try:
 except ImportError as exc:  # pragma: no cover
     raise SystemExit('PyYAML is required: pip install pyyaml') from exc
 
+# libyaml-backed loader when PyYAML was built with it; same safety as SafeLoader.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_CONFIG = SCRIPT_DIR / 'local_batch_build_config.esp-gmf.yml'
 BMGR_CMD = 'bmgr'
@@ -237,8 +242,8 @@ def _resolve_config_path(
 
 
 def _load_config(path: Path) -> BatchConfig:
-    with path.open(encoding='utf-8') as fh:
-        raw = yaml.safe_load(fh)
+    with path.open('rb') as fh:
+        raw = yaml.load(fh, Loader=_YAML_LOADER)
 
     build_raw = raw.get('build', {}) or {}
     build = BuildSettings(
@@ -350,18 +355,30 @@ def _apply_batch_dir_override(cfg: BatchConfig, new_dir: str) -> None:
     cfg.batch_build_dir = new_dir
 
 
-def _is_idf_project(directory: Path) -> bool:
-    cmake = directory / 'CMakeLists.txt'
-    if not cmake.is_file():
+# Typical app layout: project CMakeLists.txt + main/ (or components only for libs)
+_APP_LAYOUT_DIRS = frozenset(('main', 'components'))
+
+
+def _is_idf_project(directory: str, dirnames: Iterable[str], filenames: Iterable[str]) -> bool:
+    """Check an app root using the directory listing os.walk already produced."""
+    if 'CMakeLists.txt' not in filenames or _APP_LAYOUT_DIRS.isdisjoint(dirnames):
         return False
     try:
-        content = cmake.read_text(encoding='utf-8', errors='ignore')
+        # Only an ASCII marker is needed; compare bytes to skip UTF-8 decoding.
+        # Stream lines and stop at the first hit instead of loading the whole file.
+        with open(os.path.join(directory, 'CMakeLists.txt'), 'rb') as fh:
+            for line in fh:
+                if b'project(' in line:
+                    return True
     except OSError:
         return False
-    if 'project(' not in content:
-        return False
-    # Typical app layout: project CMakeLists.txt + main/ (or components only for libs)
-    return (directory / 'main').is_dir() or (directory / 'components').is_dir()
+    return False
+
+
+# (root, dir_names, exclude_segments) -> sorted app roots. The project tree does
+# not gain or lose apps during a run, and the esp-bmgr-assist fallback cleanup
+# asks for the same groups run_batch already discovered.
+_DISCOVERED_APPS: Dict[Tuple[Path, FrozenSet[str], FrozenSet[str]], Tuple[Path, ...]] = {}
 
 
 def discover_apps(root: Path, dir_names: Set[str], exclude_segments: Set[str]) -> List[Path]:
@@ -369,23 +386,36 @@ def discover_apps(root: Path, dir_names: Set[str], exclude_segments: Set[str]) -
     if not dir_names:
         return []
 
+    key = (root, frozenset(dir_names), frozenset(exclude_segments))
+    cached = _DISCOVERED_APPS.get(key)
+    if cached is None:
+        cached = _DISCOVERED_APPS[key] = tuple(_walk_apps(root, dir_names, exclude_segments))
+    return list(cached)
+
+
+def _walk_apps(root: Path, dir_names: Set[str], exclude_segments: Set[str]) -> List[Path]:
     found: List[Path] = []
     seen: Set[Path] = set()
 
-    for current, dirnames, _ in os.walk(root):
-        current_path = Path(current)
+    if _should_exclude(root, exclude_segments):
+        return []
 
-        if _should_exclude(current_path, exclude_segments):
-            dirnames[:] = []
-            continue
+    # Plain strings in the walk loop: a Path per visited directory is the
+    # dominant cost on large trees, and only matched apps need one.
+    root_str = os.fspath(root)
+    prefix_len = len(root_str)
+    for current, dirnames, filenames in os.walk(root_str, followlinks=False):
+        # Prune excluded subtrees before os.walk lists them
+        dirnames[:] = [d for d in dirnames if d not in exclude_segments]
 
-        if not _should_exclude(current_path.relative_to(root), dir_names):
+        # Components of the path below root (leading '' from the separator never matches)
+        if dir_names.isdisjoint(current[prefix_len:].split(os.sep)):
             continue
 
-        if not _is_idf_project(current_path):
+        if not _is_idf_project(current, dirnames, filenames):
             continue
 
-        resolved = current_path.resolve()
+        resolved = Path(current).resolve()
         if resolved in seen:
             continue
         seen.add(resolved)
@@ -451,17 +481,18 @@ def checkout_idf(idf_path: Path, version_tag: str, tag_flag: bool) -> str:
     return ref
 
 
+_IDF_ACTIVATION_VARS = frozenset((
+    'IDF_PATH',
+    'IDF_PYTHON_ENV_PATH',
+    'IDF_TOOLS_EXPORT_CMD',
+    'OPENOCD_SCRIPTS',
+))
+
+
 def _clean_idf_activation_env(base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """Drop stale IDF activation variables before install.sh / export.sh."""
-    env = dict(base or os.environ)
-    for key in (
-        'IDF_PATH',
-        'IDF_PYTHON_ENV_PATH',
-        'IDF_TOOLS_EXPORT_CMD',
-        'OPENOCD_SCRIPTS',
-    ):
-        env.pop(key, None)
-    return env
+    # Filter while copying rather than copying everything and popping afterwards
+    return {k: v for k, v in (base or os.environ).items() if k not in _IDF_ACTIVATION_VARS}
 
 
 def _resolve_install_targets(cfg: BatchConfig) -> Optional[str]:
@@ -588,15 +619,11 @@ def _activate_board_manager_component(env: Dict[str, str], bmgr_path: Path) -> N
 
 def _cleanup_all_project_apps(cfg: BatchConfig) -> None:
     """rm -rf build sdkconfig components/gen_bmgr_codes dependencies.lock for every discovered app."""
+    # discover_apps already returns resolved paths; an app can match both groups
     apps: List[Path] = []
-    seen: Set[Path] = set()
     for dir_names in (cfg.example_dir_names, cfg.test_dir_names):
-        for app in discover_apps(cfg.project_path, dir_names, cfg.exclude_path_segments):
-            resolved = app.resolve()
-            if resolved in seen:
-                continue
-            seen.add(resolved)
-            apps.append(resolved)
+        apps.extend(discover_apps(cfg.project_path, dir_names, cfg.exclude_path_segments))
+    apps = list(dict.fromkeys(apps))
     log.info('Cleaning board-manager artifacts in %d app(s)', len(apps))
     for app in apps:
         _cleanup_app_tree(app)
@@ -649,26 +676,38 @@ def prepare_idf_environment(
     return env
 
 
-def _target_is_idf_preview(target: str) -> bool:
+# Used when esp_bool_parser is unavailable
+_FALLBACK_PREVIEW_TARGETS = frozenset(('esp32p4', 'esp32s31'))
+
+
+@lru_cache(maxsize=None)
+def _idf_preview_targets() -> FrozenSet[str]:
+    """Resolve preview chips once; a failed import is retried by Python on every call."""
     try:
         from esp_bool_parser import PREVIEW_TARGETS
 
-        return target in PREVIEW_TARGETS
+        return frozenset(PREVIEW_TARGETS)
     except Exception:
-        return target in {'esp32p4', 'esp32s31'}
+        return _FALLBACK_PREVIEW_TARGETS
 
 
-def _idf_py_argv(env: Dict[str, str], target: str) -> List[str]:
-    """Resolve idf.py from IDF_PATH (required for nohup/non-interactive shells)."""
-    idf_root = env.get('IDF_PATH', '')
+def _target_is_idf_preview(target: str) -> bool:
+    return target in _idf_preview_targets()
+
+
+@lru_cache(maxsize=8)
+def _resolve_idf_py(idf_root: str) -> str:
+    """idf.py under *idf_root* if present, else the one on PATH; fixed per worker process."""
     if idf_root:
         idf_py = Path(idf_root) / 'tools' / 'idf.py'
         if idf_py.is_file():
-            base = [str(idf_py)]
-        else:
-            base = [shutil.which('idf.py') or 'idf.py']
-    else:
-        base = [shutil.which('idf.py') or 'idf.py']
+            return str(idf_py)
+    return shutil.which('idf.py') or 'idf.py'
+
+
+def _idf_py_argv(env: Dict[str, str], target: str) -> List[str]:
+    """Resolve idf.py from IDF_PATH (required for nohup/non-interactive shells)."""
+    base = [_resolve_idf_py(env.get('IDF_PATH', ''))]
 
     if _target_is_idf_preview(target):
         return base + ['--preview']
@@ -687,9 +726,9 @@ def _log_file_path(
 
     The caller is responsible for creating the parent directory before writing.
     """
-    safe_ver = re.sub(r'[^\w.\-]+', '_', idf_version)
-    safe_target = re.sub(r'[^\w.\-]+', '_', target)
-    safe_board = re.sub(r'[^\w.\-]+', '_', board or 'no_board')
+    safe_ver = _sanitize_path_token(idf_version)
+    safe_target = _sanitize_path_token(target)
+    safe_board = _sanitize_path_token(board or 'no_board')
     rel = app_path.name
     parent = app_path.parent.name
     stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -697,6 +736,9 @@ def _log_file_path(
     return log_root / safe_ver / safe_target / group / name
 
 
+_LOG_STATUS_PREFIXES = ('OK_', 'FAIL_', 'SKIP_')
+
+
 def _finalize_log_path(log_path: Path, success: bool, *, skipped: bool = False) -> Path:
     """Rename log file so the basename starts with OK_ / FAIL_ / SKIP_."""
     if skipped:
@@ -704,17 +746,17 @@ def _finalize_log_path(log_path: Path, success: bool, *, skipped: bool = False)
     else:
         status = 'OK' if success else 'FAIL'
     stem = log_path.name
-    for prefix in ('OK_', 'FAIL_', 'SKIP_'):
-        if stem.startswith(prefix):
-            stem = stem[len(prefix):]
-            break
+    if stem.startswith(_LOG_STATUS_PREFIXES):
+        stem = stem.split('_', 1)[1]
     final = log_path.with_name(f'{status}_{stem}')
     if final == log_path:
         return log_path
-    if log_path.is_file():
+    # The log normally exists: rename directly and only probe on the miss path
+    try:
         log_path.rename(final)
-    elif not final.is_file():
-        final.write_text('', encoding='utf-8')
+    except FileNotFoundError:
+        if not final.is_file():
+            final.write_text('', encoding='utf-8')
     return final
 
 
@@ -733,15 +775,40 @@ _SUPPORTED_TARGETS_RE = re.compile(
     r'^\s*set\s*\(\s*SUPPORTED_TARGETS\s+([^)]*)\)',
     re.IGNORECASE | re.MULTILINE,
 )
+_TARGET_LIST_SEP_RE = re.compile(r'[\s;]+')
+
+
+_T = TypeVar('_T')
+
+# (parser, path) -> (st_mtime_ns, parsed value). Override components such as
+# esp_bt_audio are shared by many apps and re-probed for every matrix cell.
+_PARSED_FILE_CACHE: Dict[Tuple[Callable[[Path], object], Path], Tuple[int, object]] = {}
+
+
+def _mtime_cached(parse: Callable[[Path], Optional[_T]], path: Path) -> Optional[_T]:
+    """Return ``parse(path)``, reusing the last result while the file mtime is unchanged."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = (parse, path)
+    cached = _PARSED_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]  # type: ignore[return-value]
+    value = parse(path)
+    _PARSED_FILE_CACHE[key] = (mtime_ns, value)
+    return value
 
 
 def _read_targets_from_component_yml(yml_path: Path) -> Optional[Set[str]]:
     """Return `targets:` from an idf_component.yml as a set; None if absent."""
-    if not yml_path.is_file():
-        return None
+    return _mtime_cached(_parse_targets_from_component_yml, yml_path)
+
+
+def _parse_targets_from_component_yml(yml_path: Path) -> Optional[Set[str]]:
     try:
-        with yml_path.open(encoding='utf-8') as fh:
-            data = yaml.safe_load(fh) or {}
+        with yml_path.open('rb') as fh:
+            data = yaml.load(fh, Loader=_YAML_LOADER) or {}
     except (yaml.YAMLError, OSError):
         return None
     raw = data.get('targets')
@@ -757,20 +824,47 @@ def _read_targets_from_component_yml(yml_path: Path) -> Optional[Set[str]]:
 
 def _read_supported_targets_from_cmake(cmake_path: Path) -> Optional[Set[str]]:
     """Parse `set(SUPPORTED_TARGETS ...)` from a CMakeLists.txt; None if absent."""
-    if not cmake_path.is_file():
-        return None
+    return _mtime_cached(_parse_supported_targets_from_cmake, cmake_path)
+
+
+def _parse_supported_targets_from_cmake(cmake_path: Path) -> Optional[Set[str]]:
     try:
         text = cmake_path.read_text(encoding='utf-8', errors='replace')
     except OSError:
         return None
+    # Most apps never mention it; skip the MULTILINE regex scan entirely. CMake
+    # variable names are case-sensitive, so only set(...) needs IGNORECASE.
+    if 'SUPPORTED_TARGETS' not in text:
+        return None
     match = _SUPPORTED_TARGETS_RE.search(text)
     if not match:
         return None
-    tokens = re.split(r'[\s;]+', match.group(1).strip())
+    tokens = _TARGET_LIST_SEP_RE.split(match.group(1).strip())
     items = {t.strip('"\'') for t in tokens if t.strip(' "\'')}
     return items or None
 
 
+def _parse_override_component_ymls(main_yml: Path) -> Optional[Tuple[Path, ...]]:
+    """Return the idf_component.yml of each override_path dependency in *main_yml*."""
+    try:
+        with main_yml.open('rb') as fh:
+            manifest = yaml.load(fh, Loader=_YAML_LOADER) or {}
+    except (yaml.YAMLError, OSError):
+        return None
+    deps = manifest.get('dependencies') or {}
+    if not isinstance(deps, dict):
+        return None
+    local_ymls: List[Path] = []
+    for spec in deps.values():
+        if not isinstance(spec, dict):
+            continue
+        override = spec.get('override_path')
+        if not override:
+            continue
+        local_ymls.append((main_yml.parent / str(override)).resolve() / 'idf_component.yml')
+    return tuple(local_ymls)
+
+
 def _app_supported_targets(app_path: Path) -> Optional[Set[str]]:
     """Discover the set of supported chips for *app_path*.
 
@@ -791,25 +885,12 @@ def _app_supported_targets(app_path: Path) -> Optional[Set[str]]:
     if top_yml is not None:
         constraints.append(top_yml)
 
-    main_yml = app_path / 'main' / 'idf_component.yml'
-    if main_yml.is_file():
-        try:
-            with main_yml.open(encoding='utf-8') as fh:
-                manifest = yaml.safe_load(fh) or {}
-        except (yaml.YAMLError, OSError):
-            manifest = {}
-        deps = manifest.get('dependencies') or {}
-        if isinstance(deps, dict):
-            for spec in deps.values():
-                if not isinstance(spec, dict):
-                    continue
-                override = spec.get('override_path')
-                if not override:
-                    continue
-                local_yml = (main_yml.parent / str(override)).resolve() / 'idf_component.yml'
-                local_targets = _read_targets_from_component_yml(local_yml)
-                if local_targets is not None:
-                    constraints.append(local_targets)
+    # A missing manifest is the common case and costs a single failed stat()
+    override_ymls = _mtime_cached(_parse_override_component_ymls, app_path / 'main' / 'idf_component.yml')
+    for local_yml in override_ymls or ():
+        local_targets = _read_targets_from_component_yml(local_yml)
+        if local_targets is not None:
+            constraints.append(local_targets)
 
     if not constraints:
         return None
@@ -1021,16 +1102,19 @@ def _run_cmd(
         _kill_process_tree(proc.pid)
         proc.wait(timeout=5)
 
-    body = stdout or ''
+    # Build output can be megabytes: write the pieces in order instead of
+    # concatenating them into successively larger strings.
+    parts = [header, stdout or '']
     if stderr:
-        body += '\n--- stderr ---\n' + stderr
-    body += f'\n\n=== exit code: {proc.returncode} ===\n'
-    block = header + body
+        parts += ['\n--- stderr ---\n', stderr]
+    parts.append(f'\n\n=== exit code: {proc.returncode} ===\n')
     if append_log and log_path.is_file():
-        with log_path.open('a', encoding='utf-8') as fh:
-            fh.write('\n' + block)
+        mode = 'a'
+        parts.insert(0, '\n')
     else:
-        log_path.write_text(block, encoding='utf-8')
+        mode = 'w'
+    with log_path.open(mode, encoding='utf-8') as fh:
+        fh.writelines(parts)
     ok = proc.returncode == 0
     summary = 'OK' if ok else f'failed (exit {proc.returncode})'
     return ok, summary
@@ -1054,17 +1138,19 @@ def _cleanup_app_tree(app_path: Path) -> None:
     """
     for rel in ('build', 'sdkconfig', 'components/gen_bmgr_codes', 'dependencies.lock'):
         path = app_path / rel
-        if not path.exists():
+        # One stat answers both "exists?" and "directory?"
+        try:
+            mode = path.stat().st_mode
+        except OSError:
             continue
-        if path.is_dir():
+        if stat.S_ISDIR(mode):
             shutil.rmtree(path, ignore_errors=True)
         else:
             path.unlink(missing_ok=True)
         log.info('Removed %s', path)
 
 
-def _board_manager_defaults_path(app_path: Path) -> Path:
-    return app_path / 'components' / 'gen_bmgr_codes' / 'board_manager.defaults'
+_BMGR_DEFAULTS_REL = 'components/gen_bmgr_codes/board_manager.defaults'
 
 
 def _sdkconfig_defaults_for_build(
@@ -1081,28 +1167,29 @@ def _sdkconfig_defaults_for_build(
     (mdc: do not rely on legacy CONFIG_ESP32_*_BOARD selectors in sdkconfig).
     """
     names: List[str] = []
-    bmgr_defaults = _board_manager_defaults_path(app_path)
-    if bmgr_applied and bmgr_defaults.is_file():
-        names.append(bmgr_defaults.relative_to(app_path).as_posix())
+    # Probe the bmgr defaults once; it goes first or last depending on bmgr_applied
+    has_bmgr_defaults = (app_path / _BMGR_DEFAULTS_REL).is_file()
+    if bmgr_applied and has_bmgr_defaults:
+        names.append(_BMGR_DEFAULTS_REL)
 
     project_defaults = cfg.build.sdkconfig_defaults.format(target=target)
-    if (app_path / project_defaults).is_file():
-        rel = project_defaults
-        if rel not in names:
-            names.append(rel)
+    if project_defaults not in names and (app_path / project_defaults).is_file():
+        names.append(project_defaults)
 
-    if not bmgr_applied and bmgr_defaults.is_file():
-        rel = bmgr_defaults.relative_to(app_path).as_posix()
-        if rel not in names:
-            names.append(rel)
+    if not bmgr_applied and has_bmgr_defaults and _BMGR_DEFAULTS_REL not in names:
+        names.append(_BMGR_DEFAULTS_REL)
 
     if not names:
         return None
     return ';'.join(names)
 
 
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[^\w.\-]+')
+
+
+@lru_cache(maxsize=256)
 def _sanitize_path_token(value: str) -> str:
-    return re.sub(r'[^\w.\-]+', '_', value)
+    return _UNSAFE_PATH_CHARS_RE.sub('_', value)
 
 
 def _app_build_slug(app_path: Path, project_root: Path) -> str:
@@ -1459,6 +1546,17 @@ def _record_batch_timing(
     return rec
 
 
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace *path* with *text* via a sibling temp file so readers never see a partial file."""
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _write_timing_json(
     results: List[BuildResult],
     cfg: BatchConfig,
@@ -1512,7 +1610,7 @@ def _write_timing_json(
     }
     text = json.dumps(payload, indent=2, ensure_ascii=False) + '\n'
     path.write_text(text, encoding='utf-8')
-    latest.write_text(text, encoding='utf-8')
+    _write_text_atomic(latest, text)
     return path
 
 
@@ -1567,14 +1665,32 @@ def _app_display_name(app_path: Path, project_root: Path) -> str:
         return str(app_path)
 
 
-def _log_href(report_path: Path, log_file: Optional[str]) -> str:
+def _partition_results(
+    results: List[BuildResult],
+) -> Tuple[List[BuildResult], List[BuildResult], List[BuildResult]]:
+    """Split *results* into (passed, failed, skipped) in one pass, preserving order."""
+    passed: List[BuildResult] = []
+    failed: List[BuildResult] = []
+    skipped: List[BuildResult] = []
+    for r in results:
+        if r.skipped:
+            skipped.append(r)
+        elif r.success:
+            passed.append(r)
+        else:
+            failed.append(r)
+    return passed, failed, skipped
+
+
+def _log_href(report_dir: Path, log_file: Optional[str]) -> str:
+    """Escaped href for *log_file* relative to the resolved *report_dir*; '' if the log is missing."""
     if not log_file:
         return ''
     log_path = Path(log_file)
     if not log_path.is_file():
-        return html.escape(log_file)
+        return ''
     try:
-        rel = log_path.resolve().relative_to(report_path.resolve().parent)
+        rel = log_path.resolve().relative_to(report_dir)
         return html.escape(rel.as_posix())
     except ValueError:
         return html.escape(log_path.as_uri())
@@ -1588,9 +1704,7 @@ def _write_html_report(results: List[BuildResult], cfg: BatchConfig) -> Path:
     report_path = log_root / f'batch_build_report_{stamp}.html'
     latest_path = log_root / 'batch_build_report_latest.html'
 
-    skipped = [r for r in results if r.skipped]
-    passed = [r for r in results if r.success]
-    failed = [r for r in results if not r.success and not r.skipped]
+    passed, failed, skipped = _partition_results(results)
     generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     total_wall = 0.0
@@ -1611,10 +1725,8 @@ def _write_html_report(results: List[BuildResult], cfg: BatchConfig) -> Path:
             status = 'FAIL'
             row_class = 'fail'
         app_name = html.escape(_app_display_name(Path(r.app_path), cfg.project_path))
-        log_rel = _log_href(report_path, r.log_file)
-        log_cell = (
-            f'<a href="{log_rel}">{log_rel}</a>' if log_rel and Path(r.log_file or '').is_file() else '—'
-        )
+        log_rel = _log_href(log_root, r.log_file)
+        log_cell = f'<a href="{log_rel}">{log_rel}</a>' if log_rel else '—'
         rows.append(
             f'<tr class="{row_class}">'
             f'<td class="status">{status}</td>'
@@ -1820,7 +1932,8 @@ def _write_html_report(results: List[BuildResult], cfg: BatchConfig) -> Path:
 </html>
 """
     report_path.write_text(page, encoding='utf-8')
-    shutil.copyfile(report_path, latest_path)
+    # Page is still in memory; write it directly rather than reading the report back
+    _write_text_atomic(latest_path, page)
     return report_path
 
 
@@ -1831,9 +1944,7 @@ def _print_summary(
     configured_jobs: int = 1,
     timing_json_path: Optional[Path] = None,
 ) -> int:
-    skipped = [r for r in results if r.skipped]
-    failed = [r for r in results if not r.success and not r.skipped]
-    passed = [r for r in results if r.success]
+    passed, failed, skipped = _partition_results(results)
 
     log.info('\n========== Build summary ==========')
     log.info(
@@ -2139,6 +2250,14 @@ def _run_batch_matrix(
     global _RUN_WALL_START
     _RUN_WALL_START = time.monotonic()
 
+    # Invariant across the matrix: resolve once instead of per (idf, board, group) cell
+    log_root = (cfg.project_path / cfg.build.log_dir).resolve()
+    app_path_groups = [
+        (group_name, [str(app.resolve()) for app in apps])
+        for group_name, apps in app_groups
+        if apps
+    ]
+
     for idf_ver in idf_versions:
         if not skip_idf_setup:
             try:
@@ -2171,21 +2290,18 @@ def _run_batch_matrix(
                 target.chip,
                 target.board or '(none)',
             )
-            for group_name, apps in app_groups:
-                if not apps:
-                    continue
-                log.info('\n--- Group: %s (%d apps) ---', group_name, len(apps))
+            for group_name, app_paths in app_path_groups:
+                log.info('\n--- Group: %s (%d apps) ---', group_name, len(app_paths))
                 tasks = [
                     BuildTask(
-                        app_path=str(app.resolve()),
+                        app_path=app_path,
                         idf_version=idf_ver,
                         target_chip=target.chip,
                         target_board=target.board,
                         group=group_name,
                     )
-                    for app in apps
+                    for app_path in app_paths
                 ]
-                log_root = (cfg.project_path / cfg.build.log_dir).resolve()
                 tasks_to_build, skipped_results = _partition_tasks_by_target_support(
                     tasks, log_root,
                 )